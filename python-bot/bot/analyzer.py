@@ -3,13 +3,22 @@ Message parsing and link claim extraction for marketing materials.
 """
 
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from typing import List, Optional, Tuple
-from urllib.parse import urlparse
+
+try:
+    # Optional: SIMD multi-pattern scanning (Linux wheels only); we fall back
+    # to the precompiled alternation regexes when unavailable
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 from .models import LinkClaim, ClaimType
 
 
-# Patterns for detecting claim types
+# Patterns for detecting claim types, compiled into single alternations so each
+# context is scanned once instead of once per pattern
 APPLICATION_PATTERNS = [
     r'\bapply\s+now\b',
     r'\bapply\s+here\b',
@@ -31,6 +40,77 @@ SPEAKER_PATTERNS = [
     r'\babout\s+(?:the\s+)?(?:speaker|author|presenter)\b',
 ]
 
+APPLICATION_RE = re.compile("|".join(f"(?:{p})" for p in APPLICATION_PATTERNS), re.IGNORECASE)
+SPEAKER_RE = re.compile("|".join(f"(?:{p})" for p in SPEAKER_PATTERNS), re.IGNORECASE)
+
+# When hyperscan is available, compile both pattern banks into one database
+# so a context is scanned in a single DFA pass; pattern ids below
+# _N_APPLICATION are application patterns, the rest are speaker patterns
+_N_APPLICATION = len(APPLICATION_PATTERNS)
+_CLAIM_DB = None
+if hyperscan is not None:
+    try:
+        _claim_exprs = [p.encode() for p in APPLICATION_PATTERNS + SPEAKER_PATTERNS]
+        _CLAIM_DB = hyperscan.Database()
+        _CLAIM_DB.compile(
+            expressions=_claim_exprs,
+            ids=list(range(len(_claim_exprs))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_claim_exprs),
+        )
+    except Exception:
+        _CLAIM_DB = None
+
+
+def _scan_claim_patterns(context: str) -> Tuple[bool, bool]:
+    """
+    Scan the context against both pattern banks in one pass.
+    Returns (matches_application, matches_speaker).
+    """
+    if _CLAIM_DB is not None:
+        hits = set()
+        _CLAIM_DB.scan(
+            context.encode(),
+            match_event_handler=lambda pat_id, start, end, flags, ctx: hits.add(pat_id),
+        )
+        return (
+            any(pat_id < _N_APPLICATION for pat_id in hits),
+            any(pat_id >= _N_APPLICATION for pat_id in hits),
+        )
+    return (
+        APPLICATION_RE.search(context) is not None,
+        SPEAKER_RE.search(context) is not None,
+    )
+
+# Patterns for names like "Jane Doe", "Dr. John Smith", etc., fused into a
+# single alternation so the context is scanned once; the first non-None
+# capture group is the extracted name
+_NAME_RE = re.compile("|".join([
+    # Name followed by colon or dash (common in speaker lists)
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*[:\-–—]',
+    # Name after "by" or "from"
+    r'(?:by|from|with|featuring)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    # Name in quotes
+    r'["\']([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)["\']',
+    # Name with title
+    r'(?:Dr\.|Mr\.|Ms\.|Mrs\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+    # Simple capitalized name pattern near [LINK]
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s*[:\-–—]?\s*\[LINK\])',
+]))
+
+# Common non-name phrases that match the capitalized-words patterns
+_NAME_FALSE_POSITIVES = frozenset(['Apply Now', 'Learn More', 'Read More', 'Click Here', 'Sign Up'])
+
+# Loose profile hints checked as a last resort before falling back to GENERIC
+_PROFILE_HINT_RE = re.compile(r'bio|profile|about me', re.IGNORECASE)
+
+# URL keywords that decide the claim type, scanned in a single pass; profile
+# markers live in the domain so they match before path-based application ones
+_URL_KEYWORD_RE = re.compile(
+    r'(?P<profile>linkedin\.com/in/|twitter\.com/)'
+    r'|(?P<application>/(?:apply|application|careers))',
+    re.IGNORECASE,
+)
+
 # URL regex pattern
 URL_PATTERN = re.compile(
     r'https?://[^\s<>\[\]()]+(?:\([^\s<>\[\]()]*\)|[^\s<>\[\](),.])*',
@@ -38,7 +118,26 @@ URL_PATTERN = re.compile(
 )
 
 # Pattern for Slack-formatted links: <url|text> or <url>
-SLACK_LINK_PATTERN = re.compile(r'<(https?://[^|>]+)(?:\|[^>]*)?>') 
+SLACK_LINK_PATTERN = re.compile(r'<(https?://[^|>]+)(?:\|[^>]*)?>')
+
+# Both URL shapes fused into one alternation so extract_urls makes a single
+# pass over the text; group 1 is a Slack-formatted link, group 2 a plain URL.
+# The Slack branch comes first so a <url|text> link is never re-captured as
+# a plain URL inside the brackets.
+_COMBINED_URL_RE = re.compile(
+    r'<(https?://[^|>]+)(?:\|[^>]*)?>'
+    r'|(https?://[^\s<>\[\]()]+(?:\([^\s<>\[\]()]*\)|[^\s<>\[\](),.])*)',
+    re.IGNORECASE,
+)
+
+# Slack user mentions like <@U12345>
+_USER_MENTION_RE = re.compile(r'<@[A-Z0-9]+>')
+
+# Newlines, for building the per-message line index
+_NEWLINE_RE = re.compile(r'\n')
+
+# List items leading with a person's name: "- Name:" or "• Name, Title:"
+_LIST_ITEM_RE = re.compile(r'^[\-•\*]\s*(?:Dr\.\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)')
 
 
 def extract_urls(text: str) -> List[Tuple[str, int, int]]:
@@ -47,88 +146,116 @@ def extract_urls(text: str) -> List[Tuple[str, int, int]]:
     Handles both plain URLs and Slack-formatted links.
     """
     urls = []
-    
-    # First, extract Slack-formatted links
-    for match in SLACK_LINK_PATTERN.finditer(text):
-        url = match.group(1)
-        urls.append((url, match.start(), match.end()))
-    
-    # Then extract plain URLs (avoiding duplicates from Slack links)
-    slack_ranges = [(u[1], u[2]) for u in urls]
-    for match in URL_PATTERN.finditer(text):
-        start, end = match.start(), match.end()
-        # Check if this URL is already captured as a Slack link
-        is_in_slack_link = any(
-            s <= start and end <= e for s, e in slack_ranges
-        )
-        if not is_in_slack_link:
-            urls.append((match.group(0), start, end))
-    
-    # Sort by position
-    urls.sort(key=lambda x: x[1])
+
+    # Every match starts at "http" (or one char earlier, at the "<" of a
+    # Slack link), so hop between candidates with str.find — which runs at
+    # C memchr speed — and only invoke the regex to validate each one,
+    # instead of stepping the engine over the whole text. The regexes are
+    # case-insensitive, so the hop scans a lowercased copy while the
+    # matches run against the original text.
+    haystack = text.lower()
+    if len(haystack) != len(text):
+        # Rare Unicode lowercasings change string length and would skew
+        # the offsets; take the plain full scan instead
+        for match in _COMBINED_URL_RE.finditer(text):
+            urls.append((match.group(1) or match.group(2), match.start(), match.end()))
+        return urls
+
+    pos = haystack.find('http')
+    while pos != -1:
+        match = None
+        if pos > 0 and text[pos - 1] == '<':
+            match = _COMBINED_URL_RE.match(text, pos - 1)
+        if match is None:
+            match = _COMBINED_URL_RE.match(text, pos)
+        if match is not None:
+            urls.append((match.group(1) or match.group(2), match.start(), match.end()))
+            pos = haystack.find('http', match.end())
+        else:
+            pos = haystack.find('http', pos + 4)
+
     return urls
 
 
-def get_context_around_url(text: str, url_start: int, url_end: int, context_chars: int = 150) -> str:
+def _newline_positions(text: str) -> List[int]:
+    """Index of every newline in the text, built once per message."""
+    return [m.start() for m in _NEWLINE_RE.finditer(text)]
+
+
+def get_context_around_url(
+    text: str,
+    url_start: int,
+    url_end: int,
+    context_chars: int = 150,
+    newline_positions: Optional[List[int]] = None,
+) -> str:
     """
     Extract the text context around a URL.
     Returns the surrounding sentence or paragraph snippet, focusing on the same line.
+
+    When a message contains many URLs, pass the result of _newline_positions
+    so line boundaries are found by bisect instead of re-scanning the text.
     """
     # First, try to get the line containing the URL
-    line_start = text.rfind('\n', 0, url_start) + 1
-    line_end = text.find('\n', url_end)
-    if line_end == -1:
-        line_end = len(text)
-    
-    # Get the line text
-    line_text = text[line_start:line_end].strip()
-    
+    if newline_positions is None:
+        line_start = text.rfind('\n', 0, url_start) + 1
+        line_end = text.find('\n', url_end)
+        if line_end == -1:
+            line_end = len(text)
+    else:
+        i = bisect_left(newline_positions, url_start)
+        line_start = newline_positions[i - 1] + 1 if i > 0 else 0
+        j = bisect_left(newline_positions, url_end)
+        line_end = newline_positions[j] if j < len(newline_positions) else len(text)
+
     # If line is too short, expand context but prefer text before the URL
-    if len(line_text) < 30:
+    if len(text[line_start:line_end].strip()) < 30:
         context_start = max(0, url_start - context_chars)
         context_end = min(len(text), url_end + 50)  # Less context after
-        context = text[context_start:context_end]
     else:
-        context = line_text
-    
-    # Clean up: remove the URL itself from context for cleaner analysis
-    url_in_context = text[url_start:url_end]
-    context = context.replace(url_in_context, "[LINK]")
-    
-    # Clean up Slack formatting artifacts
-    context = re.sub(r'<@[A-Z0-9]+>', '', context)  # Remove user mentions
+        context_start, context_end = line_start, line_end
+
+    # Clean up: splice out the URL for cleaner analysis; its offsets are
+    # already known, so no substring search is needed
+    context = text[context_start:url_start] + "[LINK]" + text[url_end:context_end]
+
+    # Clean up Slack formatting artifacts; most contexts carry no mention,
+    # so a substring probe skips the regex entirely in the common case
+    if '<@' in context:
+        context = _USER_MENTION_RE.sub('', context)  # Remove user mentions
     context = context.strip()
     
     return context
 
 
+@lru_cache(maxsize=256)
 def detect_claim_type(context: str, url: str = "") -> Tuple[ClaimType, Optional[str]]:
     """
     Detect the type of claim being made about a link based on surrounding context.
+    Results are memoized: repeated links and re-posted copy share the exact
+    same (context, url) pair, so re-scanning is skipped.
     Returns (claim_type, extracted_name) where extracted_name is for speaker profiles.
     """
-    context_lower = context.lower()
-    url_lower = url.lower()
-    
-    # Check URL for profile indicators first (more reliable)
-    if 'linkedin.com/in/' in url_lower or 'twitter.com/' in url_lower:
-        name = extract_person_name(context)
-        return ClaimType.SPEAKER_PROFILE, name
-    
-    # Check URL path for application indicators
-    if '/apply' in url_lower or '/application' in url_lower or '/careers' in url_lower:
+    # Check URL for profile/application indicators first (more reliable)
+    url_match = _URL_KEYWORD_RE.search(url)
+    if url_match:
+        if url_match.lastgroup == 'profile':
+            name = extract_person_name(context)
+            return ClaimType.SPEAKER_PROFILE, name
         return ClaimType.APPLICATION, None
     
+    # Scan both pattern banks in one pass over the context
+    matches_application, matches_speaker = _scan_claim_patterns(context)
+
     # Check for speaker/profile patterns in context (before application patterns)
     # This prevents "Apply now" from overshadowing speaker context
-    for pattern in SPEAKER_PATTERNS:
-        if re.search(pattern, context_lower):
-            name = extract_person_name(context)
-            return ClaimType.SPEAKER_PROFILE, name
+    if matches_speaker:
+        name = extract_person_name(context)
+        return ClaimType.SPEAKER_PROFILE, name
     
     # Check if context looks like a list item with a person's name
     # Pattern: "- Name:" or "• Name:" or "- Name, Title:" at start of context
-    list_item_match = re.match(r'^[\-•\*]\s*(?:Dr\.\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', context.strip())
+    list_item_match = _LIST_ITEM_RE.match(context.strip())
     if list_item_match:
         name = list_item_match.group(1)
         # Filter out false positives
@@ -136,12 +263,11 @@ def detect_claim_type(context: str, url: str = "") -> Tuple[ClaimType, Optional[
             return ClaimType.SPEAKER_PROFILE, name
     
     # Check for application-related patterns
-    for pattern in APPLICATION_PATTERNS:
-        if re.search(pattern, context_lower):
-            return ClaimType.APPLICATION, None
-    
+    if matches_application:
+        return ClaimType.APPLICATION, None
+
     # Check for common profile indicators in URL or context
-    if any(indicator in context_lower for indicator in ['bio', 'profile', 'about me']):
+    if _PROFILE_HINT_RE.search(context):
         name = extract_person_name(context)
         if name:
             return ClaimType.SPEAKER_PROFILE, name
@@ -149,34 +275,22 @@ def detect_claim_type(context: str, url: str = "") -> Tuple[ClaimType, Optional[
     return ClaimType.GENERIC, None
 
 
+@lru_cache(maxsize=256)
 def extract_person_name(context: str) -> Optional[str]:
     """
     Try to extract a person's name from the context.
     Uses simple heuristics to find capitalized name patterns.
     """
-    # Pattern for names like "Jane Doe", "Dr. John Smith", etc.
-    name_patterns = [
-        # Name followed by colon or dash (common in speaker lists)
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*[:\-–—]',
-        # Name after "by" or "from"
-        r'(?:by|from|with|featuring)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        # Name in quotes
-        r'["\']([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)["\']',
-        # Name with title
-        r'(?:Dr\.|Mr\.|Ms\.|Mrs\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-        # Simple capitalized name pattern near [LINK]
-        r'([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s*[:\-–—]?\s*\[LINK\])',
-    ]
-    
-    for pattern in name_patterns:
-        match = re.search(pattern, context)
-        if match:
-            name = match.group(1).strip()
+    match = _NAME_RE.search(context)
+    if match:
+        for name in match.groups():
+            if name is None:
+                continue
+            name = name.strip()
             # Filter out common false positives
-            false_positives = ['Apply Now', 'Learn More', 'Read More', 'Click Here', 'Sign Up']
-            if name not in false_positives:
+            if name not in _NAME_FALSE_POSITIVES:
                 return name
-    
+
     return None
 
 
@@ -192,18 +306,23 @@ def extract_links_and_claims(message_text: str) -> List[LinkClaim]:
     """
     claims = []
     urls = extract_urls(message_text)
-    
+    newline_positions = _newline_positions(message_text) if urls else []
+
     for url, start, end in urls:
-        # Validate URL
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                continue
-        except Exception:
+        # The extraction regexes guarantee an http(s) scheme but not a
+        # non-empty host (they accept e.g. http:///path), so keep cheap
+        # character checks that mirror the old urlparse netloc rejection:
+        # the authority is empty when nothing, or a path/query/fragment
+        # delimiter, follows "://"
+        sep = url.find('://')
+        host_start = sep + 3
+        if sep == -1 or host_start >= len(url) or url[host_start] in '/?#':
             continue
         
         # Get surrounding context for claim type detection
-        context = get_context_around_url(message_text, start, end)
+        context = get_context_around_url(
+            message_text, start, end, newline_positions=newline_positions
+        )
         
         # Detect claim type
         claim_type, extracted_name = detect_claim_type(context, url)
@@ -4,8 +4,8 @@ Loads and validates environment variables on startup.
 """
 
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from pydantic import BaseModel, field_validator
 from typing import Optional
 
 
@@ -13,34 +13,21 @@ from typing import Optional
 load_dotenv()
 
 
-class Config(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Config:
     """Application configuration loaded from environment variables."""
-    
+
     # Slack configuration
     slack_bot_token: str
     slack_signing_secret: str
     slack_app_token: str  # Required for Socket Mode
-    
+
     # Browserbase / Stagehand configuration
     browserbase_api_key: str
     browserbase_project_id: str
-    
+
     # Optional: OpenAI API key for Stagehand
     openai_api_key: Optional[str] = None
-    
-    @field_validator("slack_bot_token")
-    @classmethod
-    def validate_slack_bot_token(cls, v: str) -> str:
-        if not v.startswith("xoxb-"):
-            raise ValueError("SLACK_BOT_TOKEN must start with 'xoxb-'")
-        return v
-    
-    @field_validator("slack_app_token")
-    @classmethod
-    def validate_slack_app_token(cls, v: str) -> str:
-        if not v.startswith("xapp-"):
-            raise ValueError("SLACK_APP_TOKEN must start with 'xapp-'")
-        return v
 
 
 def load_config() -> Config:
@@ -48,17 +35,23 @@ def load_config() -> Config:
     Load configuration from environment variables.
     Raises ValueError if required variables are missing or invalid.
     """
-    try:
-        return Config(
-            slack_bot_token=os.environ.get("SLACK_BOT_TOKEN", ""),
-            slack_signing_secret=os.environ.get("SLACK_SIGNING_SECRET", ""),
-            slack_app_token=os.environ.get("SLACK_APP_TOKEN", ""),
-            browserbase_api_key=os.environ.get("BROWSERBASE_API_KEY", ""),
-            browserbase_project_id=os.environ.get("BROWSERBASE_PROJECT_ID", ""),
-            openai_api_key=os.environ.get("OPENAI_API_KEY"),
-        )
-    except Exception as e:
-        raise ValueError(f"Configuration error: {e}")
+    env = os.environ
+    slack_bot_token = env.get("SLACK_BOT_TOKEN", "")
+    slack_app_token = env.get("SLACK_APP_TOKEN", "")
+
+    if not slack_bot_token.startswith("xoxb-"):
+        raise ValueError("Configuration error: SLACK_BOT_TOKEN must start with 'xoxb-'")
+    if not slack_app_token.startswith("xapp-"):
+        raise ValueError("Configuration error: SLACK_APP_TOKEN must start with 'xapp-'")
+
+    return Config(
+        slack_bot_token=slack_bot_token,
+        slack_signing_secret=env.get("SLACK_SIGNING_SECRET", ""),
+        slack_app_token=slack_app_token,
+        browserbase_api_key=env.get("BROWSERBASE_API_KEY", ""),
+        browserbase_project_id=env.get("BROWSERBASE_PROJECT_ID", ""),
+        openai_api_key=env.get("OPENAI_API_KEY"),
+    )
 
 
 # Global config instance (lazy-loaded)
@@ -71,4 +64,3 @@ def get_config() -> Config:
     if _config is None:
         _config = load_config()
     return _config
-
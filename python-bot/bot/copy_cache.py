@@ -0,0 +1,50 @@
+"""
+In-process cache for copy review results.
+
+Identical (or re-posted) marketing copy is common in Slack — message edits,
+cross-posts, retried mentions — and each repeat would otherwise pay a full
+OpenAI round trip. Results are cached by an exact-match key over the model
+and normalized text.
+"""
+
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Optional
+
+# Bumped whenever the review prompt changes materially, so stale entries
+# from an older prompt are never served
+PROMPT_VERSION = "v1"
+
+
+class CopyCache:
+    """Bounded LRU cache of CopyReviewResult keyed by normalized copy text."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Cache key: model + prompt version + normalized text."""
+        normalized = text.strip().lower()
+        return sha256((model + PROMPT_VERSION + normalized).encode()).hexdigest()
+
+    def get(self, model: str, text: str):
+        """Return the cached result for this copy, or None on a miss."""
+        key = self.make_key(model, text)
+        result = self._entries.get(key)
+        if result is None:
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return result
+
+    def set(self, model: str, text: str, result) -> None:
+        """Store a review result, evicting the least recently used entry."""
+        key = self.make_key(model, text)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
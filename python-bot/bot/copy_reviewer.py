@@ -2,13 +2,103 @@
 Copy reviewer for spell checking and wording suggestions using OpenAI API.
 """
 
+import asyncio
 import os
+import random
+import re
+from datetime import date
 from typing import List, Optional
 from dataclasses import dataclass, field
 import json
 
+from .copy_cache import CopyCache
 
-@dataclass
+try:
+    # Optional: orjson decodes the OpenAI responses several times faster
+    # than stdlib json; we fall back silently when it isn't installed
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+_SYSTEM_MESSAGE = "You are an expert copywriter. Respond only with valid JSON."
+
+# Review prompt, built once at import; the copy under review is spliced in
+# at the very end, so the entire instruction block is a byte-stable prefix
+# that OpenAI's automatic prompt caching can reuse across reviews
+_PROMPT_PREFIX = """You are an expert copywriter and editor reviewing marketing material.
+
+Analyze the marketing copy at the end of this message and provide feedback on:
+1. **Spelling errors** - typos, misspellings
+2. **Grammar issues** - incorrect grammar, punctuation
+3. **Wording suggestions** - ways to make the copy clearer, more engaging, or more professional
+4. **INTERNAL CONSISTENCY** - VERY IMPORTANT! Check for conflicting information within the copy:
+   - Date ranges that don't match (e.g., header says "Jan 17-19" but body says "Jan 29")
+   - Day of week that doesn't match the date (e.g., "Saturday 1/29" when 1/29 isn't a Saturday)
+   - Conflicting times, locations, or other details mentioned in different parts
+   - Schedule items that fall outside the stated date range
+
+Respond with a JSON object in this exact format:
+{
+    "spelling_issues": [
+        {
+            "original": "the misspelled word",
+            "suggestion": "the correct spelling",
+            "context": "the sentence containing the error"
+        }
+    ],
+    "wording_suggestions": [
+        {
+            "original_phrase": "the original phrase",
+            "suggested_phrase": "improved version",
+            "reason": "why this is better",
+            "severity": "minor|moderate|important"
+        }
+    ],
+    "consistency_issues": [
+        {
+            "issue_type": "date_mismatch|day_mismatch|conflicting_info",
+            "description": "Clear explanation of the inconsistency",
+            "conflicting_items": ["First conflicting text", "Second conflicting text"],
+            "severity": "minor|moderate|critical"
+        }
+    ],
+    "overall_score": 85,
+    "summary": "Brief overall assessment of the copy quality"
+}
+
+Notes:
+- Only include actual issues, not nitpicks
+- For emojis and casual tone, don't flag as issues if they fit the marketing context
+- Focus on clarity, professionalism, and effectiveness
+- CONSISTENCY ISSUES ARE CRITICAL - date/time mismatches can confuse readers
+- Score from 0-100 where 100 is perfect
+- If no issues found, return empty arrays
+
+Marketing copy to review:
+---
+"""
+
+_PROMPT_SUFFIX = """
+---
+"""
+
+
+@dataclass(slots=True)
 class SpellingIssue:
     """A spelling or typo issue found in the text."""
     original: str
@@ -16,7 +106,7 @@ class SpellingIssue:
     context: str  # The sentence/phrase containing the issue
 
 
-@dataclass
+@dataclass(slots=True)
 class WordingIssue:
     """A wording or style suggestion."""
     original_phrase: str
@@ -25,7 +115,7 @@ class WordingIssue:
     severity: str  # "minor", "moderate", "important"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyIssue:
     """An internal consistency issue in the copy."""
     issue_type: str  # "date_mismatch", "day_mismatch", "conflicting_info"
@@ -34,7 +124,7 @@ class ConsistencyIssue:
     severity: str  # "minor", "moderate", "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyReviewResult:
     """Result of reviewing marketing copy."""
     spelling_issues: List[SpellingIssue] = field(default_factory=list)
@@ -44,9 +134,129 @@ class CopyReviewResult:
     summary: str = ""
 
 
+try:
+    # Pydantic mirrors of the result dataclasses, used both to derive the
+    # strict response schema sent to OpenAI (Structured Outputs) and for a
+    # single C-level parse+validate of the reply
+    from pydantic import BaseModel, ConfigDict
+
+    class _StrictModel(BaseModel):
+        # extra='forbid' emits additionalProperties: false, which strict
+        # structured outputs require
+        model_config = ConfigDict(extra="forbid")
+
+    class _SpellingIssueModel(_StrictModel):
+        original: str
+        suggestion: str
+        context: str
+
+    class _WordingIssueModel(_StrictModel):
+        original_phrase: str
+        suggested_phrase: str
+        reason: str
+        severity: str
+
+    class _ConsistencyIssueModel(_StrictModel):
+        issue_type: str
+        description: str
+        conflicting_items: List[str]
+        severity: str
+
+    class _CopyReviewModel(_StrictModel):
+        spelling_issues: List[_SpellingIssueModel]
+        wording_suggestions: List[_WordingIssueModel]
+        consistency_issues: List[_ConsistencyIssueModel]
+        overall_score: int
+        summary: str
+
+except ImportError:
+    _CopyReviewModel = None
+
+
+# Weekday-plus-date mentions like "Saturday, January 29" or "Sat 1/29";
+# day-of-week consistency is deterministic, so it is checked locally instead
+# of being left entirely to the model
+_DAY_DATE_RE = re.compile(
+    r'\b(?P<weekday>mon(?:day)?|tues?(?:day)?|wed(?:nesday)?|thur?s?(?:day)?|'
+    r'fri(?:day)?|sat(?:urday)?|sun(?:day)?)\b[,\s]*'
+    r'(?:(?P<month>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
+    r'jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+    r'\.?\s+(?P<day>\d{1,2})\b'
+    r'|(?P<mnum>\d{1,2})/(?P<dnum>\d{1,2})(?:/(?P<year>\d{2,4}))?)',
+    re.IGNORECASE,
+)
+
+_WEEKDAY_INDEX = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+_WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+_MONTH_INDEX = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+def check_day_date_consistency(text: str) -> List[ConsistencyIssue]:
+    """
+    Locally verify that weekday mentions match the dates next to them.
+    Without a year in the copy, the date is accepted if it matches in the
+    current or next calendar year (marketing copy is near-future).
+    """
+    issues = []
+    today = date.today()
+
+    for match in _DAY_DATE_RE.finditer(text):
+        claimed = _WEEKDAY_INDEX[match.group('weekday')[:3].lower()]
+
+        if match.group('month'):
+            month = _MONTH_INDEX[match.group('month')[:3].lower()]
+            day = int(match.group('day'))
+            year = None
+        else:
+            month = int(match.group('mnum'))
+            day = int(match.group('dnum'))
+            year = match.group('year')
+            if year:
+                year = int(year)
+                if year < 100:
+                    year += 2000
+
+        years = [year] if year else [today.year, today.year + 1]
+        actual = []
+        for y in years:
+            try:
+                actual.append(date(y, month, day).weekday())
+            except ValueError:
+                pass
+
+        if actual and claimed not in actual:
+            actual_names = " or ".join(_WEEKDAY_NAMES[d] for d in dict.fromkeys(actual))
+            issues.append(ConsistencyIssue(
+                issue_type="day_mismatch",
+                description=(
+                    f"\"{match.group(0)}\": that date falls on {actual_names}, "
+                    f"not {_WEEKDAY_NAMES[claimed]}"
+                ),
+                conflicting_items=[match.group(0)],
+                severity="critical",
+            ))
+
+    return issues
+
+
 class CopyReviewer:
     """Reviews marketing copy for spelling and wording issues using OpenAI."""
-    
+
+    # Process-wide HTTP client shared by all reviewer instances, so
+    # concurrent Slack traffic multiplexes over one warm connection pool
+    # instead of paying a TLS handshake per review
+    _client = None
+
+    # Process-wide result cache: re-posted/edited copy skips the API call
+    _cache = CopyCache()
+
+    # Bound in-flight OpenAI calls so a burst of Slack mentions doesn't
+    # trip the account's rate limit and turn into avoidable 429s
+    _sem = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "8")))
+
     def __init__(self, api_key: str = None, model: str = "gpt-4o-mini"):
         """
         Initialize the copy reviewer.
@@ -57,9 +267,53 @@ class CopyReviewer:
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY") or os.getenv("MODEL_API_KEY")
         self.model = model
-        
+
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY or MODEL_API_KEY is required for copy review")
+
+    def _get_client(self):
+        """Get the shared httpx client, creating it on first use."""
+        import httpx
+
+        if CopyReviewer._client is None:
+            CopyReviewer._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return CopyReviewer._client
+
+    async def aclose(self):
+        """Close the shared HTTP client (call on app shutdown)."""
+        if CopyReviewer._client is not None:
+            await CopyReviewer._client.aclose()
+            CopyReviewer._client = None
+
+    async def _post_with_retry(self, body: dict, max_attempts: int = 5):
+        """POST to the completions endpoint, retrying transient failures.
+
+        429s and 5xx responses are retried with jittered exponential
+        backoff, honoring the Retry-After header when the API sends one;
+        anything else raises immediately. The semaphore caps in-flight
+        calls so bursts don't trigger the rate limit in the first place.
+        """
+        client = self._get_client()
+        async with self._sem:
+            for attempt in range(max_attempts):
+                response = await client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    json=body,
+                )
+                status = response.status_code
+                if (status == 429 or status >= 500) and attempt < max_attempts - 1:
+                    delay = float(response.headers.get("retry-after", 2 ** attempt))
+                    await asyncio.sleep(delay + random.random())
+                    continue
+                response.raise_for_status()
+                return response
     
     async def review_copy(self, text: str) -> CopyReviewResult:
         """
@@ -71,98 +325,256 @@ class CopyReviewer:
         Returns:
             CopyReviewResult with issues and suggestions
         """
-        import httpx
-        
-        prompt = f"""You are an expert copywriter and editor reviewing marketing material.
+        # Structurally trivial input: don't spend an API call on copy that
+        # can't contain a reviewable issue
+        stripped = text.strip()
+        if len(stripped) < 10:
+            return CopyReviewResult(summary="Copy too short to review.")
 
-Analyze the following marketing copy and provide feedback on:
-1. **Spelling errors** - typos, misspellings
-2. **Grammar issues** - incorrect grammar, punctuation
-3. **Wording suggestions** - ways to make the copy clearer, more engaging, or more professional
-4. **INTERNAL CONSISTENCY** - VERY IMPORTANT! Check for conflicting information within the copy:
-   - Date ranges that don't match (e.g., header says "Jan 17-19" but body says "Jan 29")
-   - Day of week that doesn't match the date (e.g., "Saturday 1/29" when 1/29 isn't a Saturday)
-   - Conflicting times, locations, or other details mentioned in different parts
-   - Schedule items that fall outside the stated date range
+        # Very long copy is split into overlapping windows reviewed in
+        # parallel, instead of one prompt that blows the token budget
+        if len(stripped) > 8000:
+            return await self._review_long_copy(stripped)
 
-Marketing copy to review:
----
-{text}
----
+        # Re-posted or edited-then-restored copy is an exact cache hit;
+        # skip the model round trip entirely
+        cached = self._cache.get(self.model, text)
+        if cached is not None:
+            return cached
 
-Respond with a JSON object in this exact format:
-{{
-    "spelling_issues": [
-        {{
-            "original": "the misspelled word",
-            "suggestion": "the correct spelling",
-            "context": "the sentence containing the error"
-        }}
-    ],
-    "wording_suggestions": [
-        {{
-            "original_phrase": "the original phrase",
-            "suggested_phrase": "improved version",
-            "reason": "why this is better",
-            "severity": "minor|moderate|important"
-        }}
-    ],
-    "consistency_issues": [
-        {{
-            "issue_type": "date_mismatch|day_mismatch|conflicting_info",
-            "description": "Clear explanation of the inconsistency",
-            "conflicting_items": ["First conflicting text", "Second conflicting text"],
-            "severity": "minor|moderate|critical"
-        }}
-    ],
-    "overall_score": 85,
-    "summary": "Brief overall assessment of the copy quality"
-}}
+        # Day-of-week/date agreement is deterministic; check it locally so it
+        # is caught even if the model misses it (or the API call fails)
+        local_issues = check_day_date_consistency(text)
 
-Notes:
-- Only include actual issues, not nitpicks
-- For emojis and casual tone, don't flag as issues if they fit the marketing context
-- Focus on clarity, professionalism, and effectiveness
-- CONSISTENCY ISSUES ARE CRITICAL - date/time mismatches can confuse readers
-- Score from 0-100 where 100 is perfect
-- If no issues found, return empty arrays
-"""
-        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": "You are an expert copywriter. Respond only with valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3,
-                        "response_format": {"type": "json_object"},
-                    },
-                    timeout=30.0,
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse the response
-                content = data["choices"][0]["message"]["content"]
-                result_data = json.loads(content)
-                
-                return self._parse_result(result_data)
-                
+            response = await self._post_with_retry(self._build_request_body(text))
+            # Decode the raw bytes directly rather than going through
+            # response.json(), so orjson handles both parse steps
+            data = _json_loads(response.content)
+
+            # Parse the response
+            content = data["choices"][0]["message"]["content"]
+            result = self._parse_content(content)
+            if local_issues:
+                # Local findings win; drop the model's day_mismatch entries
+                # so the same date isn't reported twice
+                result.consistency_issues = local_issues + [
+                    issue for issue in result.consistency_issues
+                    if issue.issue_type != "day_mismatch"
+                ]
+            # Only successful reviews are cached; errors should retry
+            self._cache.set(self.model, text, result)
+            return result
+
         except Exception as e:
-            # Return empty result on error
+            # Return the local findings even when the API call fails
             return CopyReviewResult(
+                consistency_issues=local_issues,
                 summary=f"Error reviewing copy: {str(e)[:100]}"
             )
-    
+
+    async def _review_long_copy(self, text: str,
+                                window: int = 6000, overlap: int = 500) -> CopyReviewResult:
+        """Review very long copy as overlapping windows, merged into one result.
+
+        Windows overlap so issues spanning a boundary are still seen by at
+        least one review; duplicates from the overlap are dropped on merge.
+        """
+        windows = []
+        start = 0
+        while start < len(text):
+            windows.append(text[start:start + window])
+            start += window - overlap
+
+        partials = await asyncio.gather(*(self.review_copy(w) for w in windows))
+
+        merged = CopyReviewResult(
+            overall_score=min(p.overall_score for p in partials),
+            summary=f"Long copy reviewed in {len(windows)} sections.",
+        )
+        seen = set()
+        for p in partials:
+            for issue in p.spelling_issues:
+                key = ("spelling", issue.original, issue.suggestion)
+                if key not in seen:
+                    seen.add(key)
+                    merged.spelling_issues.append(issue)
+            for issue in p.wording_suggestions:
+                key = ("wording", issue.original_phrase, issue.suggested_phrase)
+                if key not in seen:
+                    seen.add(key)
+                    merged.wording_suggestions.append(issue)
+            for issue in p.consistency_issues:
+                key = ("consistency", issue.issue_type, issue.description)
+                if key not in seen:
+                    seen.add(key)
+                    merged.consistency_issues.append(issue)
+        return merged
+
+
+    def _build_request_body(self, text: str) -> dict:
+        """Chat-completions payload for reviewing one piece of copy."""
+        if _CopyReviewModel is not None:
+            # Structured outputs: the model is constrained to the exact
+            # result shape, so parsing needs no per-field defensiveness
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "copy_review",
+                    "schema": _CopyReviewModel.model_json_schema(),
+                    "strict": True,
+                },
+            }
+        else:
+            response_format = {"type": "json_object"}
+
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_MESSAGE},
+                {"role": "user", "content": _PROMPT_PREFIX + text + _PROMPT_SUFFIX},
+            ],
+            "temperature": 0.3,
+            "response_format": response_format,
+        }
+
+    def _parse_content(self, content) -> CopyReviewResult:
+        """Parse the model's JSON payload into a CopyReviewResult."""
+        if _CopyReviewModel is not None:
+            try:
+                m = _CopyReviewModel.model_validate_json(content)
+                return CopyReviewResult(
+                    spelling_issues=[
+                        SpellingIssue(i.original, i.suggestion, i.context)
+                        for i in m.spelling_issues
+                    ],
+                    wording_suggestions=[
+                        WordingIssue(i.original_phrase, i.suggested_phrase, i.reason, i.severity)
+                        for i in m.wording_suggestions
+                    ],
+                    consistency_issues=[
+                        ConsistencyIssue(i.issue_type, i.description, i.conflicting_items, i.severity)
+                        for i in m.consistency_issues
+                    ],
+                    overall_score=m.overall_score,
+                    summary=m.summary,
+                )
+            except Exception:
+                # Malformed reply: fall through to the lenient parser
+                pass
+        return self._parse_result(_json_loads(content))
+
+    async def review_copy_batch(
+        self,
+        texts: List[str],
+        poll_interval: float = 10.0,
+        max_wait: float = 24 * 3600.0,
+    ) -> List[CopyReviewResult]:
+        """
+        Review many pieces of copy via the OpenAI Batch API.
+
+        Batched requests cost half as much per token and get separate rate
+        limits, at the price of minutes-to-hours of turnaround — use this for
+        digest/scheduled runs, never for the interactive Slack path (that is
+        what review_copy is for).
+
+        Returns one CopyReviewResult per input text, in order.
+        """
+        import asyncio
+        import httpx
+
+        if not texts:
+            return []
+
+        jsonl = "\n".join(
+            _json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request_body(text),
+            })
+            for i, text in enumerate(texts)
+        )
+
+        results: List[Optional[CopyReviewResult]] = [None] * len(texts)
+
+        try:
+            # File upload is multipart, so it cannot go through the shared
+            # JSON client; a one-off client keeps the headers clean
+            async with httpx.AsyncClient(
+                timeout=60.0,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            ) as upload_client:
+                file_resp = await upload_client.post(
+                    "https://api.openai.com/v1/files",
+                    data={"purpose": "batch"},
+                    files={"file": ("reviews.jsonl", jsonl.encode(), "application/jsonl")},
+                )
+                file_resp.raise_for_status()
+                file_id = _json_loads(file_resp.content)["id"]
+
+            client = self._get_client()
+            batch_resp = await client.post(
+                "https://api.openai.com/v1/batches",
+                json={
+                    "input_file_id": file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h",
+                },
+            )
+            batch_resp.raise_for_status()
+            batch = _json_loads(batch_resp.content)
+
+            waited = 0.0
+            while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+                if waited >= max_wait:
+                    raise TimeoutError(f"Batch {batch['id']} still {batch['status']} after {waited:.0f}s")
+                await asyncio.sleep(poll_interval)
+                waited += poll_interval
+                status_resp = await client.get(f"https://api.openai.com/v1/batches/{batch['id']}")
+                status_resp.raise_for_status()
+                batch = _json_loads(status_resp.content)
+
+            if batch["status"] != "completed" or not batch.get("output_file_id"):
+                raise RuntimeError(f"Batch {batch['id']} ended with status {batch['status']}")
+
+            output_resp = await client.get(
+                f"https://api.openai.com/v1/files/{batch['output_file_id']}/content"
+            )
+            output_resp.raise_for_status()
+
+            for line in output_resp.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = _json_loads(line)
+                index = int(entry["custom_id"])
+                try:
+                    content = entry["response"]["body"]["choices"][0]["message"]["content"]
+                    result = self._parse_content(content)
+                    local_issues = check_day_date_consistency(texts[index])
+                    if local_issues:
+                        result.consistency_issues = local_issues + [
+                            issue for issue in result.consistency_issues
+                            if issue.issue_type != "day_mismatch"
+                        ]
+                    results[index] = result
+                except Exception as e:
+                    results[index] = CopyReviewResult(
+                        summary=f"Error parsing batch result: {str(e)[:100]}"
+                    )
+
+        except Exception as e:
+            error = f"Batch review error: {str(e)[:100]}"
+            return [
+                r if r is not None else CopyReviewResult(summary=error)
+                for r in results
+            ]
+
+        return [
+            r if r is not None else CopyReviewResult(summary="No batch result returned")
+            for r in results
+        ]
+
     def _parse_result(self, data: dict) -> CopyReviewResult:
         """Parse the OpenAI response into a CopyReviewResult."""
         spelling_issues = []
@@ -200,6 +612,16 @@ Notes:
         )
 
 
+# Display tables for format_review_result, built once at import
+_WORDING_SEVERITY_EMOJI = {"minor": "💡", "moderate": "📝", "important": "⚡"}
+_CONSISTENCY_SEVERITY_EMOJI = {"minor": "💡", "moderate": "⚠️", "critical": "🚨"}
+_CONSISTENCY_TYPE_LABEL = {
+    "date_mismatch": "Date Mismatch",
+    "day_mismatch": "Day/Date Mismatch",
+    "conflicting_info": "Conflicting Info",
+}
+
+
 def format_review_result(result: CopyReviewResult) -> str:
     """Format the review result for display."""
     lines = ["*📝 Copy Review Results*\n"]
@@ -232,7 +654,7 @@ def format_review_result(result: CopyReviewResult) -> str:
     if result.wording_suggestions:
         lines.append(f"\n*✍️ Wording Suggestions ({len(result.wording_suggestions)}):*")
         for suggestion in result.wording_suggestions:
-            severity_emoji = {"minor": "💡", "moderate": "📝", "important": "⚡"}.get(suggestion.severity, "💡")
+            severity_emoji = _WORDING_SEVERITY_EMOJI.get(suggestion.severity, "💡")
             lines.append(f"  {severity_emoji} \"{suggestion.original_phrase}\"")
             lines.append(f"     → \"{suggestion.suggested_phrase}\"")
             if suggestion.reason:
@@ -242,12 +664,8 @@ def format_review_result(result: CopyReviewResult) -> str:
     if result.consistency_issues:
         lines.append(f"\n*⚠️ Consistency Issues ({len(result.consistency_issues)}):*")
         for issue in result.consistency_issues:
-            severity_emoji = {"minor": "💡", "moderate": "⚠️", "critical": "🚨"}.get(issue.severity, "⚠️")
-            type_label = {
-                "date_mismatch": "Date Mismatch",
-                "day_mismatch": "Day/Date Mismatch", 
-                "conflicting_info": "Conflicting Info"
-            }.get(issue.issue_type, "Issue")
+            severity_emoji = _CONSISTENCY_SEVERITY_EMOJI.get(issue.severity, "⚠️")
+            type_label = _CONSISTENCY_TYPE_LABEL.get(issue.issue_type, "Issue")
             lines.append(f"  {severity_emoji} *{type_label}*: {issue.description}")
             if issue.conflicting_items:
                 for item in issue.conflicting_items:
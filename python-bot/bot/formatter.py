@@ -2,10 +2,53 @@
 Slack response formatting for verification results.
 """
 
+from collections import Counter
 from typing import List
 from .models import VerificationResult, AlignmentStatus, ClaimType
 
 
+# Display tables, built once instead of per formatted result
+_STATUS_TEXT = {
+    AlignmentStatus.ALIGNED: "*Aligned*",
+    AlignmentStatus.QUESTIONABLE: "*Needs Review*",
+    AlignmentStatus.MISALIGNED: "*Misaligned*",
+    AlignmentStatus.ERROR: "*Error*",
+}
+
+_STATUS_TEXT_PLAIN = {
+    AlignmentStatus.ALIGNED: "Aligned",
+    AlignmentStatus.QUESTIONABLE: "Needs Review",
+    AlignmentStatus.MISALIGNED: "Misaligned",
+    AlignmentStatus.ERROR: "Error",
+}
+
+_ELLIPSIS = "..."
+
+_CLAIM_TYPE_TEXT = {
+    ClaimType.APPLICATION: "Application page check",
+    ClaimType.SPEAKER_PROFILE: "Speaker profile check",
+    ClaimType.GENERIC: "Content relevance check",
+}
+
+# Fixed Slack blocks, shared by reference across replies — callers must
+# not mutate these
+_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "📋 Link Verification Results",
+        "emoji": True
+    }
+}
+
+_DIVIDER_BLOCK = {"type": "divider"}
+
+
+def _section(text: str) -> dict:
+    """Build a mrkdwn section block."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
 def format_slack_reply(results: List[VerificationResult]) -> str:
     """
     Format verification results as a Slack-friendly message.
@@ -19,14 +62,15 @@ def format_slack_reply(results: List[VerificationResult]) -> str:
     if not results:
         return "No links were found in your message to verify."
     
-    # Build summary stats
-    aligned = sum(1 for r in results if r.status == AlignmentStatus.ALIGNED)
-    questionable = sum(1 for r in results if r.status == AlignmentStatus.QUESTIONABLE)
-    misaligned = sum(1 for r in results if r.status == AlignmentStatus.MISALIGNED)
-    errors = sum(1 for r in results if r.status == AlignmentStatus.ERROR)
+    # Build summary stats in one pass
+    counts = Counter(r.status for r in results)
+    aligned = counts[AlignmentStatus.ALIGNED]
+    questionable = counts[AlignmentStatus.QUESTIONABLE]
+    misaligned = counts[AlignmentStatus.MISALIGNED]
+    errors = counts[AlignmentStatus.ERROR]
     
     # Header with summary
-    lines = ["*📋 Link Verification Results*\n"]
+    lines = ["*📋 Link Verification Results*\n\n"]
     
     # Summary line
     total = len(results)
@@ -40,13 +84,16 @@ def format_slack_reply(results: List[VerificationResult]) -> str:
     if errors > 0:
         summary_parts.append(f"{errors} error(s)")
     
-    lines.append(f"_{total} link(s) checked: {', '.join(summary_parts)}_\n")
-    
-    # Individual results
+    lines.append(f"_{total} link(s) checked: {', '.join(summary_parts)}_\n\n")
+
+    # Individual results, with explicit separators so the whole reply is
+    # joined exactly once; re-rendered results come from the cache
     for i, result in enumerate(results, 1):
         lines.append(format_single_result(i, result))
-    
-    return "\n".join(lines)
+        if i != total:
+            lines.append("\n")
+
+    return "".join(lines)
 
 
 def format_single_result(index: int, result: VerificationResult) -> str:
@@ -60,37 +107,80 @@ def format_single_result(index: int, result: VerificationResult) -> str:
     Returns:
         Formatted string for this result
     """
+    # Message edits and working->final transitions re-render identical
+    # results; serve those from the cache instead of reformatting
+    key = _result_cache_key(index, result)
+    if key is not None:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    parts = []
+    _append_result(parts, index, result)
+    text = "".join(parts)
+
+    if key is not None:
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+            _RESULT_CACHE.clear()
+        _RESULT_CACHE[key] = text
+    return text
+
+
+# Formatting is a pure function of the (frozen) result, but results hold a
+# details dict and so aren't hashable themselves; the cache keys on a
+# derived tuple of the fields instead
+_RESULT_CACHE = {}
+_RESULT_CACHE_MAX = 1024
+
+
+def _result_cache_key(index: int, result: VerificationResult):
+    """Hashable cache key for a result, or None if details won't hash."""
+    try:
+        key = (
+            index,
+            result.url,
+            result.claim_type,
+            result.status,
+            result.confidence,
+            result.short_reason,
+            result.page_title,
+            result.error_message,
+            tuple(sorted(result.details.items())),
+        )
+        hash(key)  # detail values may themselves be unhashable
+        return key
+    except TypeError:
+        return None
+
+
+def clear_format_cache() -> None:
+    """Drop cached formatted results (teardown/test hook)."""
+    _RESULT_CACHE.clear()
+
+
+def _append_result(parts: list, index: int, result: VerificationResult) -> None:
+    """Append the fragments for one result directly onto the caller's list."""
     # Status display
-    status_text = {
-        AlignmentStatus.ALIGNED: "*Aligned*",
-        AlignmentStatus.QUESTIONABLE: "*Needs Review*",
-        AlignmentStatus.MISALIGNED: "*Misaligned*",
-        AlignmentStatus.ERROR: "*Error*",
-    }.get(result.status, "*Unknown*")
-    
+    status_text = _STATUS_TEXT.get(result.status, "*Unknown*")
+
     # Claim type context
-    claim_type_text = {
-        ClaimType.APPLICATION: "Application page check",
-        ClaimType.SPEAKER_PROFILE: "Speaker profile check",
-        ClaimType.GENERIC: "Content relevance check",
-    }.get(result.claim_type, "Link check")
+    claim_type_text = _CLAIM_TYPE_TEXT.get(result.claim_type, "Link check")
     
-    # Build the result line
+    # Build the result as fragments appended to the shared list, joined
+    # once by the caller instead of growing a string with repeated +=
     emoji = result.status_emoji
-    
+
     # Truncate URL for display if too long
-    display_url = result.url
-    if len(display_url) > 60:
-        display_url = display_url[:57] + "..."
-    
+    display_url = _truncate_url(result.url, max_length=60)
+
     # Main line
-    line = f"*Link {index}:* `{display_url}`\n"
-    line += f"  {emoji} {status_text} – {result.short_reason}"
-    
+    parts.append(f"*Link {index}:* `{display_url}`\n")
+    parts.append(f"  {emoji} {status_text} – {result.short_reason}")
+
     # Add page title if available
-    if result.page_title and result.status != AlignmentStatus.ERROR:
-        line += f"\n  _Page: \"{result.page_title}\"_"
-    
+    if result.page_title and result.status is not AlignmentStatus.ERROR:
+        parts.append(f"\n  _Page: \"{result.page_title}\"_")
+
     # Add event date/time info if available
     if result.details:
         if result.details.get("date_mismatch"):
@@ -99,31 +189,31 @@ def format_single_result(index: int, result: VerificationResult) -> str:
             copy_time = result.details.get("copy_time", "")
             event_date = result.details.get("event_date", "")
             event_time = result.details.get("event_time", "")
-            
-            line += f"\n  ⚠️ *Date/Time Mismatch Detected:*"
+
+            parts.append("\n  ⚠️ *Date/Time Mismatch Detected:*")
             if copy_date and event_date:
-                line += f"\n    • Copy mentions: `{copy_date}` → Page shows: `{event_date}`"
+                parts.append(f"\n    • Copy mentions: `{copy_date}` → Page shows: `{event_date}`")
             if copy_time and event_time:
-                line += f"\n    • Copy mentions: `{copy_time}` → Page shows: `{event_time}`"
+                parts.append(f"\n    • Copy mentions: `{copy_time}` → Page shows: `{event_time}`")
         elif result.details.get("is_event_page"):
             # Show event info for aligned events
             event_date = result.details.get("event_date", "")
             event_time = result.details.get("event_time", "")
             if event_date or event_time:
-                line += f"\n  📅 Event: {event_date}"
+                parts.append(f"\n  📅 Event: {event_date}")
                 if event_time:
-                    line += f" at {event_time}"
-    
+                    parts.append(f" at {event_time}")
+
     # Add confidence indicator for non-errors
-    if result.status != AlignmentStatus.ERROR:
+    if result.status is not AlignmentStatus.ERROR:
         confidence_pct = int(result.confidence * 100)
-        line += f" ({confidence_pct}% confidence)"
-    
+        parts.append(f" ({confidence_pct}% confidence)")
+
     # Add error details if applicable
     if result.error_message:
-        line += f"\n  _Error: {result.error_message}_"
-    
-    return line + "\n"
+        parts.append(f"\n  _Error: {result.error_message}_")
+
+    parts.append("\n")
 
 
 def format_working_message() -> str:
@@ -152,22 +242,13 @@ def create_blocks_message(results: List[VerificationResult]) -> list:
     Returns:
         List of Slack block elements
     """
-    blocks = []
-    
-    # Header
-    blocks.append({
-        "type": "header",
-        "text": {
-            "type": "plain_text",
-            "text": "📋 Link Verification Results",
-            "emoji": True
-        }
-    })
-    
-    # Summary section
-    aligned = sum(1 for r in results if r.status == AlignmentStatus.ALIGNED)
-    questionable = sum(1 for r in results if r.status == AlignmentStatus.QUESTIONABLE)
-    misaligned = sum(1 for r in results if r.status == AlignmentStatus.MISALIGNED)
+    blocks = [_HEADER_BLOCK]
+
+    # Summary section, counted in one pass
+    counts = Counter(r.status for r in results)
+    aligned = counts[AlignmentStatus.ALIGNED]
+    questionable = counts[AlignmentStatus.QUESTIONABLE]
+    misaligned = counts[AlignmentStatus.MISALIGNED]
     
     summary_text = f"{len(results)} link(s) checked: "
     summary_parts = []
@@ -179,46 +260,26 @@ def create_blocks_message(results: List[VerificationResult]) -> list:
         summary_parts.append(f"❌ {misaligned} misaligned")
     summary_text += " | ".join(summary_parts) if summary_parts else "No results"
     
-    blocks.append({
-        "type": "section",
-        "text": {
-            "type": "mrkdwn",
-            "text": summary_text
-        }
-    })
-    
-    blocks.append({"type": "divider"})
+    blocks.append(_section(summary_text))
+    blocks.append(_DIVIDER_BLOCK)
     
     # Individual results
     for i, result in enumerate(results, 1):
         emoji = result.status_emoji
-        status_text = {
-            AlignmentStatus.ALIGNED: "Aligned",
-            AlignmentStatus.QUESTIONABLE: "Needs Review",
-            AlignmentStatus.MISALIGNED: "Misaligned",
-            AlignmentStatus.ERROR: "Error",
-        }.get(result.status, "Unknown")
+        status_text = _STATUS_TEXT_PLAIN.get(result.status, "Unknown")
         
         result_text = f"*Link {i}:* <{result.url}|{_truncate_url(result.url)}>\n"
         result_text += f"{emoji} *{status_text}* – {result.short_reason}"
         
         if result.page_title:
             result_text += f"\n_Page: \"{result.page_title}\"_"
-        
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": result_text
-            }
-        })
+
+        blocks.append(_section(result_text))
     
     return blocks
 
 
 def _truncate_url(url: str, max_length: int = 50) -> str:
     """Truncate a URL for display."""
-    if len(url) <= max_length:
-        return url
-    return url[:max_length - 3] + "..."
+    return url if len(url) <= max_length else url[:max_length - 3] + _ELLIPSIS
 
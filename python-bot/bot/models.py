@@ -3,7 +3,7 @@ Data models for the Marketing Link Verifier bot.
 """
 
 from dataclasses import dataclass, field
-from typing import Literal, Optional, Dict, Any
+from typing import ClassVar, Literal, Optional, Dict, Any
 from enum import Enum
 
 
@@ -22,7 +22,7 @@ class AlignmentStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkClaim:
     """Represents a link extracted from marketing copy with its contextual claim."""
     url: str
@@ -31,9 +31,14 @@ class LinkClaim:
     extracted_name: Optional[str] = None  # For speaker profiles, the expected person's name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
-    """Result of verifying a link against its claim."""
+    """Result of verifying a link against its claim.
+
+    Instances are immutable once built; use dataclasses.replace to derive
+    a modified copy. Note `details` is still a plain dict, so results are
+    not hashable — caches key on a derived tuple instead.
+    """
     url: str
     claim_type: ClaimType
     status: AlignmentStatus
@@ -42,19 +47,22 @@ class VerificationResult:
     page_title: Optional[str] = None
     details: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
+
+    # Shared lookup table; ClassVar so it isn't slot-allocated per instance
+    _STATUS_EMOJI: ClassVar[Dict[AlignmentStatus, str]] = {
+        AlignmentStatus.ALIGNED: "✅",
+        AlignmentStatus.QUESTIONABLE: "⚠️",
+        AlignmentStatus.MISALIGNED: "❌",
+        AlignmentStatus.ERROR: "🚫",
+    }
     
     @property
     def is_aligned(self) -> bool:
         """Check if the link is aligned with its claim."""
-        return self.status == AlignmentStatus.ALIGNED
+        return self.status is AlignmentStatus.ALIGNED
     
     @property
     def status_emoji(self) -> str:
         """Get the emoji representing the alignment status."""
-        return {
-            AlignmentStatus.ALIGNED: "✅",
-            AlignmentStatus.QUESTIONABLE: "⚠️",
-            AlignmentStatus.MISALIGNED: "❌",
-            AlignmentStatus.ERROR: "🚫",
-        }.get(self.status, "❓")
+        return self._STATUS_EMOJI.get(self.status, "❓")
 
@@ -10,6 +10,7 @@ Usage:
 """
 
 import sys
+from collections import Counter
 from bot.analyzer import extract_links_and_claims, summarize_claims
 from bot.models import ClaimType
 
@@ -35,6 +36,11 @@ Register here: https://aisummit2026.com/register
 """
 
 
+# Cap on --file input so a huge file can't trigger one giant allocation
+# and an unbounded regex scan
+MAX_COPY_CHARS = 1 << 20
+
+
 def print_header(text: str):
     """Print a formatted header."""
     print("\n" + "=" * 60)
@@ -42,23 +48,29 @@ def print_header(text: str):
     print("=" * 60)
 
 
-def print_claim(index: int, claim):
-    """Print a single claim in a readable format."""
-    claim_type_labels = {
-        ClaimType.APPLICATION: "📝 APPLICATION",
-        ClaimType.SPEAKER_PROFILE: "👤 SPEAKER PROFILE", 
-        ClaimType.GENERIC: "🔗 GENERIC LINK",
-    }
-    
-    label = claim_type_labels.get(claim.claim_type, "❓ UNKNOWN")
-    
-    print(f"\n[Link {index}] {label}")
-    print(f"  URL: {claim.url}")
-    
+# Display labels, built once instead of per printed claim
+_CLAIM_LABELS = {
+    ClaimType.APPLICATION: "📝 APPLICATION",
+    ClaimType.SPEAKER_PROFILE: "👤 SPEAKER PROFILE",
+    ClaimType.GENERIC: "🔗 GENERIC LINK",
+}
+
+
+def format_claim(index: int, claim) -> str:
+    """Format a single claim as a readable block."""
+    label = _CLAIM_LABELS.get(claim.claim_type, "❓ UNKNOWN")
+
+    lines = [f"\n[Link {index}] {label}", f"  URL: {claim.url}"]
+
     if claim.extracted_name:
-        print(f"  Expected Person: {claim.extracted_name}")
-    
-    print(f"  Context: \"{claim.claim_context[:100]}{'...' if len(claim.claim_context) > 100 else ''}\"")
+        lines.append(f"  Expected Person: {claim.extracted_name}")
+
+    # Slice the context once and reuse it
+    context = claim.claim_context
+    ellipsis = '...' if len(context) > 100 else ''
+    lines.append(f"  Context: \"{context[:100]}{ellipsis}\"")
+
+    return "\n".join(lines)
 
 
 def main():
@@ -67,8 +79,12 @@ def main():
         if sys.argv[1] == "--file" and len(sys.argv) > 2:
             # Read from file
             try:
-                with open(sys.argv[2], 'r') as f:
-                    copy = f.read()
+                # Explicit UTF-8 so emoji-heavy copy doesn't depend on the
+                # platform default encoding
+                with open(sys.argv[2], 'r', encoding='utf-8', errors='replace') as f:
+                    copy = f.read(MAX_COPY_CHARS)
+                    if f.read(1):
+                        print(f"⚠️  File exceeds {MAX_COPY_CHARS} characters; analyzing the first part only")
                 print(f"📄 Reading from file: {sys.argv[2]}")
             except FileNotFoundError:
                 print(f"❌ File not found: {sys.argv[2]}")
@@ -101,9 +117,10 @@ def main():
     # Print summary
     print(f"\n📊 Found {len(claims)} link(s):")
     
-    app_count = sum(1 for c in claims if c.claim_type == ClaimType.APPLICATION)
-    speaker_count = sum(1 for c in claims if c.claim_type == ClaimType.SPEAKER_PROFILE)
-    generic_count = sum(1 for c in claims if c.claim_type == ClaimType.GENERIC)
+    counts = Counter(c.claim_type for c in claims)
+    app_count = counts[ClaimType.APPLICATION]
+    speaker_count = counts[ClaimType.SPEAKER_PROFILE]
+    generic_count = counts[ClaimType.GENERIC]
     
     if app_count:
         print(f"   • {app_count} application link(s)")
@@ -112,27 +129,30 @@ def main():
     if generic_count:
         print(f"   • {generic_count} generic link(s)")
     
-    # Print each claim
-    for i, claim in enumerate(claims, 1):
-        print_claim(i, claim)
-    
+    # Print each claim in one write instead of several per claim
+    print("\n".join(format_claim(i, claim) for i, claim in enumerate(claims, 1)))
+
     print_header("WHAT THE BOT WOULD CHECK")
-    
+
+    lines = []
     for i, claim in enumerate(claims, 1):
-        print(f"\n[Link {i}] {claim.url}")
-        
+        lines.append(f"\n[Link {i}] {claim.url}")
+
         if claim.claim_type == ClaimType.APPLICATION:
-            print("  ➡️  Bot will verify: Is this page an application/job form?")
-            print("      Looking for: form fields, 'apply', 'submit', job titles")
-        
+            lines.append("  ➡️  Bot will verify: Is this page an application/job form?")
+            lines.append("      Looking for: form fields, 'apply', 'submit', job titles")
+
         elif claim.claim_type == ClaimType.SPEAKER_PROFILE:
             name = claim.extracted_name or "the mentioned person"
-            print(f"  ➡️  Bot will verify: Is this page about {name}?")
-            print("      Looking for: name match, bio, title, company, photo")
-        
+            lines.append(f"  ➡️  Bot will verify: Is this page about {name}?")
+            lines.append("      Looking for: name match, bio, title, company, photo")
+
         else:
-            print("  ➡️  Bot will verify: Is page content relevant to surrounding text?")
-            print(f"      Context: \"{claim.claim_context[:50]}...\"")
+            snippet = claim.claim_context[:50]
+            lines.append("  ➡️  Bot will verify: Is page content relevant to surrounding text?")
+            lines.append(f"      Context: \"{snippet}...\"")
+
+    print("\n".join(lines))
     
     print("\n" + "=" * 60)
     print("✅ Analysis complete! Run with Slack integration to verify links.")
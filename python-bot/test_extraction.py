@@ -5,11 +5,15 @@ Usage:
     python test_extraction.py <url>
     python test_extraction.py https://lu.ma/some-event
     python test_extraction.py http://v1michigan.com/ship-it
+    python test_extraction.py --debug <url>   # Also dump the raw response object
 """
 
+import asyncio
+import queue
 import sys
 import os
 import json
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -30,124 +34,159 @@ EVENT_SCHEMA = {
     "required": ["is_event_page", "page_title", "confidence", "reason"],
 }
 
+# Cap on concurrent Browserbase sessions for multi-URL runs
+_MAX_PARALLEL_SESSIONS = 4
 
-def test_extraction(url: str):
-    """Test extraction for a single URL."""
-    from stagehand import Stagehand
-    
-    api_key = os.getenv("BROWSERBASE_API_KEY")
-    project_id = os.getenv("BROWSERBASE_PROJECT_ID")
-    model_api_key = os.getenv("MODEL_API_KEY") or os.getenv("OPENAI_API_KEY")
-    
-    if not api_key or not project_id:
-        print("❌ Missing BROWSERBASE_API_KEY or BROWSERBASE_PROJECT_ID")
-        return
-    
+EXTRACT_INSTRUCTION = (
+    "Look at this event page and find these specific pieces of information:\n\n"
+    "1. PAGE TITLE: What is the main event name shown in the heading?\n"
+    "2. DATE: What date is shown for this event? Look for text like 'Saturday, January 27' or 'Jan 27-29' or 'Past Event'. This is usually displayed prominently on the page.\n"
+    "3. TIME: What time is shown? Look for text like '3:00 PM' or '3-6 PM EST'\n"
+    "4. LOCATION: What venue or address is shown? Or is it 'Online'?\n\n"
+    "Copy the EXACT text you see on the page for each field. If you cannot find a field, leave it empty string."
+)
+
+
+def open_session(client) -> str:
+    """Create a Stagehand session shared by all URLs and return its id."""
+    print("🤘 Creating Stagehand session...")
+    session = client.sessions.create(model_name="gpt-4o")
+    session_id = session.id
+    print(f"✅ Session created: {session_id[:12]}...")
+    print(f"👀 Watch live: https://www.browserbase.com/sessions/{session_id}")
+    return session_id
+
+
+def extract_one(client, session_id: str, url: str, debug: bool = False):
+    """Navigate the shared session to a URL and dump the raw extraction."""
     print(f"\n{'='*60}")
     print(f"Testing URL: {url}")
     print(f"{'='*60}\n")
-    
+
+    # Navigate to URL
+    print(f"📍 Navigating to {url}...")
+    client.sessions.navigate(session_id, url=url)
+    print("✅ Page loaded, waiting for content...")
+
+    # Wait for dynamic content to load
+    time.sleep(2)
+
+    # Extract event data
+    print("\n🔍 Extracting event data...")
+    response = client.sessions.extract(
+        session_id,
+        instruction=EXTRACT_INSTRUCTION,
+        schema=EVENT_SCHEMA,
+    )
+
+    print("\n" + "="*60)
+    print("RAW EXTRACTION RESULT:")
+    print("="*60)
+
+    # The full reflection dump can run to multiple KB per response, so
+    # normal runs skip it
+    if debug:
+        print(f"\nResponse type: {type(response)}")
+        print(f"\nResponse: {response}")
+        print(f"\nResponse __dict__: {getattr(response, '__dict__', None)}")
+
+    # Try to get the actual extracted values: one attribute walk instead
+    # of repeated hasattr probes over the same chain
     try:
-        # Initialize Stagehand (synchronous API like in stagehand_client.py)
-        client = Stagehand(
-            browserbase_api_key=api_key,
-            browserbase_project_id=project_id,
-            model_api_key=model_api_key,
-        )
-        
-        print("🤘 Creating Stagehand session...")
-        session = client.sessions.create(model_name="gpt-4o")
-        session_id = session.id
-        print(f"✅ Session created: {session_id[:12]}...")
-        print(f"👀 Watch live: https://www.browserbase.com/sessions/{session_id}")
-        
-        # Navigate to URL
-        print(f"\n📍 Navigating to {url}...")
-        client.sessions.navigate(session_id, url=url)
-        print("✅ Page loaded, waiting for content...")
-        
-        # Wait for dynamic content to load
-        import time
-        time.sleep(2)
-        
-        # Extract event data
-        print("\n🔍 Extracting event data...")
-        response = client.sessions.extract(
-            session_id,
-            instruction=(
-                "Look at this event page and find these specific pieces of information:\n\n"
-                "1. PAGE TITLE: What is the main event name shown in the heading?\n"
-                "2. DATE: What date is shown for this event? Look for text like 'Saturday, January 27' or 'Jan 27-29' or 'Past Event'. This is usually displayed prominently on the page.\n"
-                "3. TIME: What time is shown? Look for text like '3:00 PM' or '3-6 PM EST'\n"
-                "4. LOCATION: What venue or address is shown? Or is it 'Online'?\n\n"
-                "Copy the EXACT text you see on the page for each field. If you cannot find a field, leave it empty string."
-            ),
-            schema=EVENT_SCHEMA,
-        )
-        
+        data = response.data.result
+    except AttributeError:
+        data = response if isinstance(response, dict) else None
+
+    if data:
         print("\n" + "="*60)
-        print("RAW EXTRACTION RESULT:")
+        print("EXTRACTED EVENT DATA:")
         print("="*60)
-        
-        # Print the raw response
-        print(f"\nResponse type: {type(response)}")
-        print(f"\nResponse: {response}")
-        
-        # Try to extract data from different formats
-        if hasattr(response, 'data'):
-            print(f"\nresponse.data: {response.data}")
-            if hasattr(response.data, 'result'):
-                print(f"\nresponse.data.result: {response.data.result}")
-        
-        if hasattr(response, '__dict__'):
-            print(f"\nResponse __dict__: {response.__dict__}")
-        
-        # Try to get the actual extracted values
-        data = None
-        if hasattr(response, 'data') and hasattr(response.data, 'result'):
-            data = response.data.result
-        elif isinstance(response, dict):
-            data = response
-        
-        if data:
-            print("\n" + "="*60)
-            print("EXTRACTED EVENT DATA:")
-            print("="*60)
+        # Pretty-print only for humans; piped runs get compact one-line
+        # JSON, which is cheaper to build and to parse downstream
+        if sys.stdout.isatty():
             print(json.dumps(data, indent=2, default=str))
-            
-            print("\n📋 Summary:")
-            print(f"  • Is Event Page: {data.get('is_event_page', 'N/A')}")
-            print(f"  • Page Title: {data.get('page_title', 'N/A')}")
-            print(f"  • Event Date: {data.get('event_date', 'N/A')}")
-            print(f"  • Event Time: {data.get('event_time', 'N/A')}")
-            print(f"  • Location: {data.get('event_location', 'N/A')}")
-            print(f"  • Confidence: {data.get('confidence', 'N/A')}")
-        
-        # End session
-        print("\n🔚 Ending session...")
-        client.sessions.end(session_id)
+        else:
+            print(json.dumps(data, default=str, separators=(',', ':')))
+
+        print("\n📋 Summary:")
+        print(f"  • Is Event Page: {data.get('is_event_page', 'N/A')}")
+        print(f"  • Page Title: {data.get('page_title', 'N/A')}")
+        print(f"  • Event Date: {data.get('event_date', 'N/A')}")
+        print(f"  • Event Time: {data.get('event_time', 'N/A')}")
+        print(f"  • Location: {data.get('event_location', 'N/A')}")
+        print(f"  • Confidence: {data.get('confidence', 'N/A')}")
+
+
+async def extract_all(client, urls, debug: bool = False):
+    """Extract every URL, running up to _MAX_PARALLEL_SESSIONS in parallel.
+
+    Sessions are pooled and leased per URL (same pattern as
+    StagehandClient), so N URLs still cost at most the pool size in
+    session startups while the network-bound navigate/extract calls
+    overlap in worker threads.
+    """
+    pool_size = min(_MAX_PARALLEL_SESSIONS, len(urls))
+    sessions = queue.Queue()
+    for _ in range(pool_size):
+        sessions.put(open_session(client))
+
+    def worker(url: str):
+        session_id = sessions.get()
+        try:
+            extract_one(client, session_id, url, debug=debug)
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            sessions.put(session_id)
+
+    try:
+        await asyncio.gather(*(asyncio.to_thread(worker, url) for url in urls))
+    finally:
+        # End sessions
+        print("\n🔚 Ending sessions...")
+        while not sessions.empty():
+            client.sessions.end(sessions.get())
         print("✅ Done!")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
 
 
 def main():
-    if len(sys.argv) < 2:
+    debug = "--debug" in sys.argv
+    urls = [a for a in sys.argv[1:] if a != "--debug"]
+    if not urls:
         # Default test URLs
         urls = [
             "http://v1michigan.com/ship-it",
         ]
         print("No URL provided. Testing default URLs...")
-    else:
-        urls = sys.argv[1:]
-    
-    for url in urls:
-        test_extraction(url)
+
+    from stagehand import Stagehand
+
+    api_key = os.getenv("BROWSERBASE_API_KEY")
+    project_id = os.getenv("BROWSERBASE_PROJECT_ID")
+    model_api_key = os.getenv("MODEL_API_KEY") or os.getenv("OPENAI_API_KEY")
+
+    if not api_key or not project_id:
+        print("❌ Missing BROWSERBASE_API_KEY or BROWSERBASE_PROJECT_ID")
+        return
+
+    # Initialize Stagehand (synchronous API like in stagehand_client.py) and
+    # amortize one session across every URL instead of paying session
+    # startup per URL
+    client = Stagehand(
+        browserbase_api_key=api_key,
+        browserbase_project_id=project_id,
+        model_api_key=model_api_key,
+    )
+
+    try:
+        asyncio.run(extract_all(client, urls, debug=debug))
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
 
 
 if __name__ == "__main__":
     main()
-
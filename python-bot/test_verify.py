@@ -19,18 +19,18 @@ Modes:
     --review-only: Skip link verification, only review copy text
 """
 
+import argparse
 import sys
 import asyncio
+from collections import Counter
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 from bot.analyzer import extract_links_and_claims
-from bot.stagehand_client import StagehandClient
 from bot.formatter import format_slack_reply
 from bot.models import LinkClaim, ClaimType, AlignmentStatus
-from bot.copy_reviewer import CopyReviewer, format_review_result
 
 # Sample marketing copy for testing
 SAMPLE_COPY = """
@@ -43,6 +43,19 @@ Meet our research lead:
 """
 
 
+# Cap on --file input so a huge file can't trigger one giant allocation
+# and an unbounded regex scan
+MAX_COPY_CHARS = 1 << 20
+
+# Display labels, built once instead of per printed result
+_STATUS_TEXT = {
+    AlignmentStatus.ALIGNED: "ALIGNED",
+    AlignmentStatus.QUESTIONABLE: "NEEDS REVIEW",
+    AlignmentStatus.MISALIGNED: "MISALIGNED",
+    AlignmentStatus.ERROR: "ERROR",
+}
+
+
 def print_header(text: str):
     """Print a formatted header."""
     print("\n" + "=" * 60)
@@ -50,10 +63,8 @@ def print_header(text: str):
     print("=" * 60)
 
 
-async def verify_single_url(url: str, claim_type: str = "generic", use_direct: bool = False):
+async def verify_single_url(url: str, client: "StagehandClient", claim_type: str = "generic"):
     """Verify a single URL directly."""
-    client = StagehandClient(use_direct_mode=use_direct)
-    
     # Create a simple claim for the URL
     type_map = {
         "application": ClaimType.APPLICATION,
@@ -69,14 +80,14 @@ async def verify_single_url(url: str, claim_type: str = "generic", use_direct: b
     
     print(f"\n🔍 Verifying: {url}")
     print(f"   Type: {claim_type}")
-    print(f"   Mode: {'Direct HTTP' if use_direct else 'Browserbase'}")
+    print(f"   Mode: {'Direct HTTP' if client.use_direct_mode else 'Browserbase'}")
     print("   Please wait...")
     
     results = await client.analyze_links([claim])
     return results
 
 
-async def verify_marketing_copy(copy: str, use_direct: bool = False):
+async def verify_marketing_copy(copy: str, client: "StagehandClient"):
     """Verify all links in marketing copy."""
     # Extract links and claims
     print_header("EXTRACTING LINKS")
@@ -93,16 +104,15 @@ async def verify_marketing_copy(copy: str, use_direct: bool = False):
     # Verify each link
     print_header("VERIFYING LINKS")
     
-    if use_direct:
+    if client.use_direct_mode:
         print("\n🔍 Analyzing pages with direct HTTP requests...")
         print("   (Faster but simpler analysis - no JavaScript rendering)\n")
     else:
         print("\n🔍 Analyzing pages with Browserbase...")
-        print("   (This may take 10-30 seconds per link)\n")
-    
-    client = StagehandClient(use_direct_mode=use_direct)
+        print("   (Links are verified concurrently; expect ~10-30 seconds total)\n")
+
     results = await client.analyze_links(claims)
-    
+
     return results
 
 
@@ -114,11 +124,12 @@ def print_results(results):
         print("\n⚠️  No results to display.")
         return
     
-    # Summary
-    aligned = sum(1 for r in results if r.status == AlignmentStatus.ALIGNED)
-    questionable = sum(1 for r in results if r.status == AlignmentStatus.QUESTIONABLE)
-    misaligned = sum(1 for r in results if r.status == AlignmentStatus.MISALIGNED)
-    errors = sum(1 for r in results if r.status == AlignmentStatus.ERROR)
+    # Summary, counted in one pass
+    counts = Counter(r.status for r in results)
+    aligned = counts[AlignmentStatus.ALIGNED]
+    questionable = counts[AlignmentStatus.QUESTIONABLE]
+    misaligned = counts[AlignmentStatus.MISALIGNED]
+    errors = counts[AlignmentStatus.ERROR]
     
     print(f"\n📊 Summary: {len(results)} link(s) verified")
     if aligned:
@@ -130,31 +141,29 @@ def print_results(results):
     if errors:
         print(f"   🚫 {errors} error(s)")
     
-    # Individual results
+    # Individual results, emitted in one write instead of several per result
+    lines = []
     for i, result in enumerate(results, 1):
         emoji = result.status_emoji
-        status_text = {
-            AlignmentStatus.ALIGNED: "ALIGNED",
-            AlignmentStatus.QUESTIONABLE: "NEEDS REVIEW",
-            AlignmentStatus.MISALIGNED: "MISALIGNED",
-            AlignmentStatus.ERROR: "ERROR",
-        }.get(result.status, "UNKNOWN")
-        
-        print(f"\n[Link {i}] {emoji} {status_text}")
-        print(f"  URL: {result.url}")
-        print(f"  Type: {result.claim_type.value}")
-        print(f"  Reason: {result.short_reason}")
-        
+        status_text = _STATUS_TEXT.get(result.status, "UNKNOWN")
+
+        lines.append(f"\n[Link {i}] {emoji} {status_text}")
+        lines.append(f"  URL: {result.url}")
+        lines.append(f"  Type: {result.claim_type.value}")
+        lines.append(f"  Reason: {result.short_reason}")
+
         if result.page_title:
-            print(f"  Page Title: \"{result.page_title}\"")
-        
-        print(f"  Confidence: {int(result.confidence * 100)}%")
-        
+            lines.append(f"  Page Title: \"{result.page_title}\"")
+
+        lines.append(f"  Confidence: {int(result.confidence * 100)}%")
+
         if result.details:
-            print(f"  Details: {result.details}")
-        
+            lines.append(f"  Details: {result.details}")
+
         if result.error_message:
-            print(f"  Error: {result.error_message}")
+            lines.append(f"  Error: {result.error_message}")
+
+    print("\n".join(lines))
     
     # Also show Slack-formatted output
     print_header("SLACK-FORMATTED OUTPUT (LINKS)")
@@ -166,7 +175,8 @@ async def review_copy_text(copy: str):
     """Review marketing copy for spelling and wording issues."""
     print_header("REVIEWING COPY")
     print("\n📝 Analyzing text for spelling and wording...")
-    
+
+    from bot.copy_reviewer import CopyReviewer
     reviewer = CopyReviewer()
     result = await reviewer.review_copy(copy)
     
@@ -175,19 +185,43 @@ async def review_copy_text(copy: str):
 
 def print_review_results(result):
     """Print copy review results."""
+    from bot.copy_reviewer import format_review_result
+
     print_header("COPY REVIEW RESULTS")
     print()
     print(format_review_result(result))
 
 
+def parse_args():
+    """Parse command-line arguments in a single pass."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("text", nargs="*", help="Marketing copy to verify")
+    parser.add_argument("--direct", action="store_true",
+                        help="Use direct HTTP mode (no Browserbase needed)")
+    parser.add_argument("--review", action="store_true",
+                        help="Also review copy for spelling/wording")
+    parser.add_argument("--review-only", dest="review_only", action="store_true",
+                        help="Only review copy (skip link verification)")
+    parser.add_argument("--file", metavar="PATH",
+                        help="Read marketing copy from a file")
+    parser.add_argument("--url", metavar="URL",
+                        help="Verify a single URL directly")
+    parser.add_argument("--type", default="generic",
+                        choices=("application", "speaker", "generic"),
+                        help="Claim type for --url (default: generic)")
+    return parser.parse_args()
+
+
 async def main():
     import os
-    
-    # Check for flags
-    use_direct = "--direct" in sys.argv
-    do_review = "--review" in sys.argv
-    review_only = "--review-only" in sys.argv
-    args = [a for a in sys.argv[1:] if a not in ("--direct", "--review", "--review-only")]
+
+    opts = parse_args()
+    use_direct = opts.direct
+    do_review = opts.review
+    review_only = opts.review_only
     
     # Check for required environment variables
     if review_only or do_review:
@@ -229,54 +263,68 @@ async def main():
     # Parse arguments and get copy text
     copy = None
     results = []
-    
-    if len(args) > 0:
-        if args[0] == "--help" or args[0] == "-h":
-            print(__doc__)
-            sys.exit(0)
-        
-        elif args[0] == "--url" and len(args) > 1:
+
+    # One client per run, shared by the single-URL and copy paths so they
+    # reuse the same connection pools and caches
+    client = None
+
+    try:
+        if opts.url:
             # Verify single URL (no copy review for single URL mode)
-            url = args[1]
-            claim_type = args[2] if len(args) > 2 else "generic"
-            results = await verify_single_url(url, claim_type, use_direct)
+            claim_type = opts.type
+            if opts.text and opts.text[0] in ("application", "speaker", "generic"):
+                # Back-compat: claim type used to follow the URL positionally
+                claim_type = opts.text[0]
+            from bot.stagehand_client import StagehandClient
+            client = StagehandClient(use_direct_mode=use_direct)
+            results = await verify_single_url(opts.url, client, claim_type)
             print_results(results)
-        
-        elif args[0] == "--file" and len(args) > 1:
+
+        elif opts.file:
             # Read from file
             try:
-                with open(args[1], 'r') as f:
-                    copy = f.read()
-                print(f"📄 Reading from file: {args[1]}")
+                # Explicit UTF-8 so emoji-heavy copy doesn't depend on the
+                # platform default encoding
+                with open(opts.file, 'r', encoding='utf-8', errors='replace') as f:
+                    copy = f.read(MAX_COPY_CHARS)
+                    if f.read(1):
+                        print(f"⚠️  File exceeds {MAX_COPY_CHARS} characters; verifying the first part only")
+                print(f"📄 Reading from file: {opts.file}")
             except FileNotFoundError:
-                print(f"❌ File not found: {args[1]}")
+                print(f"❌ File not found: {opts.file}")
                 sys.exit(1)
-        
-        else:
+
+        elif opts.text:
             # Use command line argument as the copy
-            copy = " ".join(args)
+            copy = " ".join(opts.text)
             print("📝 Verifying provided text...")
-    
-    else:
-        # Use sample copy
-        print("📝 Using sample marketing copy")
-        print("   (Pass your own text as an argument, or use --url for single URLs)")
-        print_header("INPUT")
-        print(SAMPLE_COPY)
-        copy = SAMPLE_COPY
-    
-    # Process copy if we have it
-    if copy:
-        # Link verification (unless review-only)
-        if not review_only:
-            results = await verify_marketing_copy(copy, use_direct)
-            print_results(results)
-        
-        # Copy review (if enabled)
-        if do_review or review_only:
-            review_result = await review_copy_text(copy)
-            print_review_results(review_result)
-    
+
+        else:
+            # Use sample copy
+            print("📝 Using sample marketing copy")
+            print("   (Pass your own text as an argument, or use --url for single URLs)")
+            print_header("INPUT")
+            print(SAMPLE_COPY)
+            copy = SAMPLE_COPY
+
+        # Process copy if we have it
+        if copy:
+            # Link verification (unless review-only)
+            if not review_only:
+                if client is None:
+                    from bot.stagehand_client import StagehandClient
+                    client = StagehandClient(use_direct_mode=use_direct)
+                results = await verify_marketing_copy(copy, client)
+                print_results(results)
+
+            # Copy review (if enabled)
+            if do_review or review_only:
+                review_result = await review_copy_text(copy)
+                print_review_results(review_result)
+    finally:
+        if client is not None:
+            await client.aclose()
+
     print("\n" + "=" * 60)
     print("✅ Complete!")
     print("=" * 60 + "\n")